@@ -5,10 +5,9 @@
 # F. Ihlen, Introduction to multifractal detrended fluctuation analysis in
 # Matlab, Front. Physiol., 2012, https://doi.org/10.3389/fphys.2012.00141
 
-from typing import Tuple
+from typing import Optional, Tuple
 
 import numpy as np
-from numpy.polynomial.polynomial import polyfit
 
 __all__ = [
     'singularity_spectrum',
@@ -21,7 +20,9 @@ __all__ = [
 
 
 def singularity_spectrum(lag: np.array, mfdfa: np.ndarray, q: np.array,
-                         lim: list = [False, False], interpolate: int = False
+                         lim: Optional[Tuple[int, int]] = None,
+                         interpolate: int = False,
+                         log_lag: np.array = None, log_mfdfa: np.ndarray = None
                          ) -> Tuple[np.array, np.array]:
     """
     Extract the slopes of the fluctuation function to further obtain the
@@ -40,15 +41,25 @@ def singularity_spectrum(lag: np.array, mfdfa: np.ndarray, q: np.array,
     q: np.array
         Fractal exponents used. Must be more than 2 points.
 
-    lim: list (default `[int(lag.size // 1.5), int(lag.size // 8)]`)
-        List of lower and upper lag limits. If you wish to consider the full
-        range, use `None` to unbound the limits (lower or upper) and thus
-        consider the full lag, e.g., `lim=[None, None]`.
+    lim: tuple of ints (default None)
+        Lower and upper lag limits of the fittings. If `None`, the fittings
+        are restricted to `(lag.size // 8, lag.size // 1.5)`. If you wish to
+        consider the full range, use `None` to unbound the limits (lower or
+        upper) and thus consider the full lag, e.g., `lim=(None, None)`.
 
     interpolate: int (default False)
         Interpolates the `q` space to smoothed the singularity spectrum. Not
         yet implemented.
 
+    log_lag: np.array (default None)
+        Advanced. Precomputed `np.log(lag)` over the full `lag`. Useful when
+        repeatedly calling with different `lim`, e.g., in stability scans of
+        the fitting range, to avoid recalculating the logarithms.
+
+    log_mfdfa: np.ndarray (default None)
+        Advanced. Precomputed `np.log(mfdfa)`, of the same shape as `mfdfa`.
+        See `log_lag`.
+
     Returns
     -------
     alpha: np.array
@@ -65,6 +76,10 @@ def singularity_spectrum(lag: np.array, mfdfa: np.ndarray, q: np.array,
     -----
     .. versionadded:: 0.4.1
 
+    .. versionchanged:: 0.4.4
+        Added `log_lag` and `log_mfdfa`. `lim` defaults to `None` instead of
+        `[False, False]`.
+
     References
     ----------
     .. [Kantelhardt2002] J. W. Kantelhardt, S. A. Zschiegner, E.
@@ -73,22 +88,12 @@ def singularity_spectrum(lag: np.array, mfdfa: np.ndarray, q: np.array,
         A, 316(1-4), 87–114, 2002.
     """
 
-    # if no lower limit is given
-    if lim[0] is False:
-        lim[0] = int(lag.size // 8)
-
-    # if no upper limit is given
-    if lim[1] is False:
-         lim[1] = int(lag.size // 1.5)
-
-    # clean q
-    q = _clean_q(q)
-
-    # Calculate tau
-    _, tau = scaling_exponents(lag, mfdfa, q, lim, interpolate)
+    # Calculate tau, which also cleans q
+    q, tau = scaling_exponents(lag, mfdfa, q, lim, interpolate,
+                               log_lag=log_lag, log_mfdfa=log_mfdfa)
 
     # Calculate α, which needs tau
-    alpha = np.gradient(tau) / np.gradient(q)
+    alpha = _central_diff(tau, q)
 
     # Calculate Dq, which needs tau and q
     f = _falpha(tau, alpha, q)
@@ -97,7 +102,9 @@ def singularity_spectrum(lag: np.array, mfdfa: np.ndarray, q: np.array,
 
 
 def scaling_exponents(lag: np.array, mfdfa: np.ndarray, q: np.array,
-                      lim: list = [False, False], interpolate: int = False
+                      lim: Optional[Tuple[int, int]] = None,
+                      interpolate: int = False,
+                      log_lag: np.array = None, log_mfdfa: np.ndarray = None
                       ) -> Tuple[np.array, np.array]:
     """
     Calculate the multifractal scaling exponents `τ(q)`, which is given by
@@ -123,15 +130,25 @@ def scaling_exponents(lag: np.array, mfdfa: np.ndarray, q: np.array,
     q: np.array
         Fractal exponents used. Must be more than 2 points.
 
-    lim: list (default `[int(lag.size // 1.5), int(lag.size // 8)]`)
-        List of lower and upper lag limits. If none, the polynomial fittings
-        will be restrict to half the maximal lag and discard the first lag
-        point.
+    lim: tuple of ints (default None)
+        Lower and upper lag limits of the fittings. If `None`, the fittings
+        are restricted to `(lag.size // 8, lag.size // 1.5)`. If you wish to
+        consider the full range, use `None` to unbound the limits (lower or
+        upper) and thus consider the full lag, e.g., `lim=(None, None)`.
 
     interpolate: int (default False)
         Interpolates the `q` space to smoothed the singularity spectrum. Not
         yet implemented.
 
+    log_lag: np.array (default None)
+        Advanced. Precomputed `np.log(lag)` over the full `lag`. Useful when
+        repeatedly calling with different `lim`, e.g., in stability scans of
+        the fitting range, to avoid recalculating the logarithms.
+
+    log_mfdfa: np.ndarray (default None)
+        Advanced. Precomputed `np.log(mfdfa)`, of the same shape as `mfdfa`.
+        See `log_lag`.
+
     Returns
     -------
     q: np.array
@@ -148,6 +165,10 @@ def scaling_exponents(lag: np.array, mfdfa: np.ndarray, q: np.array,
     -----
     .. versionadded:: 0.4.1
 
+    .. versionchanged:: 0.4.4
+        Added `log_lag` and `log_mfdfa`. `lim` defaults to `None` instead of
+        `[False, False]`.
+
     References
     ----------
     .. [Kantelhardt2002] J. W. Kantelhardt, S. A. Zschiegner, E.
@@ -156,25 +177,20 @@ def scaling_exponents(lag: np.array, mfdfa: np.ndarray, q: np.array,
         A, 316(1-4), 87–114, 2002.
     """
 
-    # if no lower limit is given
-    if lim[0] is False:
-        lim[0] = int(lag.size // 8)
-
-    # if no upper limit is given
-    if lim[1] is False:
-         lim[1] = int(lag.size // 1.5)
-
-    # clean q
-    q = _clean_q(q)
+    # Calculate the slopes, which also cleans q
+    q, slopes = _slopes(lag, mfdfa, q, lim, log_lag=log_lag,
+                        log_mfdfa=log_mfdfa)
 
-    # Calculate the slopes
-    slopes = _slopes(lag, mfdfa, q, lim, interpolate)
+    tau = np.multiply(q, slopes)
+    tau -= 1
 
-    return q, (q * slopes) - 1
+    return q, tau
 
 
 def hurst_exponents(lag: np.array, mfdfa: np.ndarray, q: np.array,
-                    lim: list = [False, False], interpolate: int = False
+                    lim: Optional[Tuple[int, int]] = None,
+                    interpolate: int = False,
+                    log_lag: np.array = None, log_mfdfa: np.ndarray = None
                     ) -> Tuple[np.array, np.array]:
     """
     Calculate the generalised Hurst exponents `h(q)` from MFDFA, which
@@ -196,15 +212,25 @@ def hurst_exponents(lag: np.array, mfdfa: np.ndarray, q: np.array,
     q: np.array
         Fractal exponents used. Must be more than 2 points.
 
-    lim: list (default `[int(lag.size // 1.5), int(lag.size // 8)]`)
-        List of lower and upper lag limits. If you wish to consider the full
-        range, use `None` to unbound the limits (lower or upper) and thus
-        consider the full lag, e.g., `lim=[None, None]`.
+    lim: tuple of ints (default None)
+        Lower and upper lag limits of the fittings. If `None`, the fittings
+        are restricted to `(lag.size // 8, lag.size // 1.5)`. If you wish to
+        consider the full range, use `None` to unbound the limits (lower or
+        upper) and thus consider the full lag, e.g., `lim=(None, None)`.
 
     interpolate: int (default False)
         Interpolates the `q` space to smoothed the singularity spectrum. Not
         yet implemented.
 
+    log_lag: np.array (default None)
+        Advanced. Precomputed `np.log(lag)` over the full `lag`. Useful when
+        repeatedly calling with different `lim`, e.g., in stability scans of
+        the fitting range, to avoid recalculating the logarithms.
+
+    log_mfdfa: np.ndarray (default None)
+        Advanced. Precomputed `np.log(mfdfa)`, of the same shape as `mfdfa`.
+        See `log_lag`.
+
     Returns
     -------
     q: np.array
@@ -219,6 +245,10 @@ def hurst_exponents(lag: np.array, mfdfa: np.ndarray, q: np.array,
     -----
     .. versionadded:: 0.4.1
 
+    .. versionchanged:: 0.4.4
+        Added `log_lag` and `log_mfdfa`. `lim` defaults to `None` instead of
+        `[False, False]`.
+
     References
     ----------
     .. [Kantelhardt2002] J. W. Kantelhardt, S. A. Zschiegner, E.
@@ -227,29 +257,24 @@ def hurst_exponents(lag: np.array, mfdfa: np.ndarray, q: np.array,
         A, 316(1-4), 87–114, 2002.
     """
 
-    # if no lower limit is given
-    if lim[0] is False:
-        lim[0] = int(lag.size // 8)
-
-    # if no upper limit is given
-    if lim[1] is False:
-         lim[1] = int(lag.size // 1.5)
-
-    # clean q
-    q = _clean_q(q)
-
-    # Calculate the slopes
-    hq = _slopes(lag, mfdfa, q, lim, interpolate)
+    # Calculate the slopes, which also cleans q
+    q, hq = _slopes(lag, mfdfa, q, lim, log_lag=log_lag,
+                    log_mfdfa=log_mfdfa)
 
     return q, hq
 
 
 def _slopes(lag: np.array, mfdfa: np.ndarray, q: np.array,
-            lim: list = [None, None], modified=True, interpolate: int = False
-            ) -> np.array:
+            lim: Optional[Tuple[int, int]] = None, modified=True,
+            interpolate: int = False,
+            log_lag: np.array = None, log_mfdfa: np.ndarray = None
+            ) -> Tuple[np.array, np.array]:
     """
     Extra the slopes of each `q` power obtained with MFDFA to later produce
-    either the singularity spectrum or the multifractal exponents.
+    either the singularity spectrum or the multifractal exponents. Returns
+    the cleaned `q` together with the slopes. The logarithms of the full
+    `lag` and `mfdfa` can be given via `log_lag` and `log_mfdfa` to avoid
+    recalculating them.
 
     Notes
     -----
@@ -257,39 +282,172 @@ def _slopes(lag: np.array, mfdfa: np.ndarray, q: np.array,
 
     """
 
-    # if no lower limit is given
-    if lim[0] is False:
-        lim[0] = int(lag.size // 8)
-
-    # if no upper limit is given
-    if lim[1] is False:
-         lim[1] = int(lag.size // 1.5)
+    # Resolve the lag limits into indices of lag
+    lo, hi = _resolve_lim(lag, lim)
 
     # clean q
     q = _clean_q(q)
 
-    # Fractal powers as floats
-    q = np.asarray_chkfinite(q, dtype=float)
-
     # Ensure mfdfa has the same q-power entries as q
     if mfdfa.shape[1] != q.shape[0]:
         raise ValueError(
             "Fluctuation function and q powers don't match in dimension."
         )
 
-    # Allocated array for slopes
-    slopes = np.zeros(len(q))
+    log_lag, log_mfdfa = _precompute_logs(lag, mfdfa, lo, hi, log_lag,
+                                          log_mfdfa)
+
+    return q, _slopes_raw(log_lag, log_mfdfa)
 
-    # Find slopes of each q-power
-    for i in range(len(q)):
-        slopes[i] = polyfit(np.log(lag[lim[0]:lim[1]]),
-                            np.log(mfdfa[lim[0]:lim[1], i]),
-                            1
-                            )[1]
+
+def _slopes_raw(log_lag: np.array, log_mfdfa: np.ndarray) -> np.array:
+    """
+    Slope fitting of `_slopes`, given the logarithms `log_lag` and
+    `log_mfdfa` within the lag limits, as obtained with `_precompute_logs`.
+    `_slopes` cleans `q` with `_clean_q` and checks it against `mfdfa`.
+
+    Notes
+    -----
+    .. versionadded:: 0.4.4
+
+    """
+
+    # Ensure there are enough lags to fit a line
+    if log_lag.size < 2:
+        raise ValueError(
+            "At least 2 lags are needed within `lim` to fit the slopes."
+        )
+
+    # Find slopes of all q-powers with the closed-form linear regression. The
+    # centred lags and their sum of squares do not depend on q, and since the
+    # centred lags sum to zero, the mean of each q-column need not be removed
+    xc = log_lag - log_lag.mean()
+    denom = np.dot(xc, xc)
+
+    # Ensure the lags are not all the same, which leaves the slopes undefined
+    if denom == 0:
+        raise ValueError(
+            "At least 2 distinct lags are needed within `lim` to fit the "
+            "slopes."
+        )
+
+    slopes = (xc @ log_mfdfa) / denom
 
     return slopes
 
 
+def _resolve_lim(lag: np.array, lim: Optional[Tuple[int, int]]
+                 ) -> Tuple[int, int]:
+    """
+    Resolve the lag limits `lim` into the integer indices `(lo, hi)` of
+    `lag` to fit within. If `lim` is `None`, the default
+    `(lag.size // 8, lag.size // 1.5)` is taken. Otherwise, a limit of `None`
+    unbounds it, and a limit of `False` takes its default, as in the former
+    default `lim=[False, False]`. Negative limits count from the end of
+    `lag`, as in slicing. `lim` itself is not modified.
+
+    Notes
+    -----
+    .. versionadded:: 0.4.4
+
+    """
+
+    # if no limits are given
+    if lim is None:
+        lim = (False, False)
+
+    lo, hi = lim
+
+    # if no lower limit is given
+    if lo is False:
+        lo = lag.size // 8
+    elif lo is None:
+        lo = 0
+
+    # if no upper limit is given
+    if hi is False:
+        hi = lag.size // 1.5
+    elif hi is None:
+        hi = lag.size
+
+    # Normalise the limits into indices within lag, as in slicing
+    lo, hi, _ = slice(int(lo), int(hi)).indices(lag.size)
+
+    # Ensure the window holds enough lags to fit the slopes
+    if hi - lo < 2:
+        raise ValueError(
+            "At least 2 lags are needed within `lim` to fit the slopes."
+        )
+
+    return lo, hi
+
+
+def _precompute_logs(lag: np.array, mfdfa: np.ndarray, lo: int, hi: int,
+                     log_lag: np.array = None, log_mfdfa: np.ndarray = None
+                     ) -> Tuple[np.array, np.ndarray]:
+    """
+    Calculate the logarithms of `lag` and `mfdfa` between the indices `lo`
+    and `hi`, such that they can be shared by the slope fittings. If the
+    logarithms of the full `lag` or `mfdfa` are given via `log_lag` or
+    `log_mfdfa`, these are sliced instead of recalculated.
+
+    Notes
+    -----
+    .. versionadded:: 0.4.4
+
+    """
+
+    if log_lag is not None:
+        log_lag = np.asarray(log_lag, dtype=np.float64)
+        if log_lag.shape != lag.shape:
+            raise ValueError(
+                "Logarithm of the lags and lags don't match in dimension."
+            )
+        log_lag = log_lag[lo:hi]
+    else:
+        log_lag = np.log(np.ascontiguousarray(lag[lo:hi], dtype=np.float64))
+
+    if log_mfdfa is not None:
+        log_mfdfa = np.asarray(log_mfdfa, dtype=np.float64)
+        if log_mfdfa.shape != mfdfa.shape:
+            raise ValueError(
+                "Logarithm of the fluctuation function and fluctuation "
+                "function don't match in dimension."
+            )
+        return log_lag, log_mfdfa[lo:hi, :]
+
+    # Write the logarithm of the fluctuation function directly into a
+    # Fortran-ordered buffer, such that each q-column is contiguous
+    window = mfdfa[lo:hi, :]
+    log_mfdfa = np.empty(window.shape, dtype=np.float64, order='F')
+    np.log(window, out=log_mfdfa)
+
+    return log_lag, log_mfdfa
+
+
+def _central_diff(a: np.array, b: np.array) -> np.array:
+    """
+    Derivative `da/db` by central differences in the interior and one-sided
+    differences at the end points, equivalent to
+    `np.gradient(a) / np.gradient(b)`.
+
+    Notes
+    -----
+    .. versionadded:: 0.4.4
+    """
+    if a.size < 2:
+        raise ValueError(
+            "At least 2 q powers are needed to calculate the derivative."
+        )
+
+    out = np.empty_like(a)
+    out[1:-1] = (a[2:] - a[:-2]) / (b[2:] - b[:-2])
+    out[0] = (a[1] - a[0]) / (b[1] - b[0])
+    out[-1] = (a[-1] - a[-2]) / (b[-1] - b[-2])
+
+    return out
+
+
 def _falpha(tau, alpha, q) -> np.array:
     """
     Calculate the singularity spectrum or fractal dimension `f(α)`.
@@ -298,11 +456,17 @@ def _falpha(tau, alpha, q) -> np.array:
     -----
     .. versionadded:: 0.4.1
     """
-    return q * alpha - tau
+    f = np.multiply(q, alpha)
+    np.subtract(f, tau, out=f)
+
+    return f
 
 
 # Plotters
 
+# matplotlib.pyplot, imported lazily by `_plotter`
+_plt = None
+
 
 def singularity_spectrum_plot(alpha, f) -> np.array:
     """
@@ -411,13 +575,13 @@ def hurst_exponents_plot(q, hq) -> Tuple['plt.fig', 'plt.Axes']:
 def _clean_q(q) -> np.array:
 
     # Fractal powers as floats
-    q = np.asarray_chkfinite(q, dtype=float)
+    q = np.asarray_chkfinite(q, dtype=np.float64)
 
     # Ensure q≈0 is removed, since it does not converge. Limit set at |q| < 0.1
-    q = q[(q < -.1) + (q > .1)]
+    q = q[np.abs(q) > .1]
 
     # Reshape q to perform np.float_power
-    q = q.flatten()
+    q = q.ravel()
 
     return q
 
@@ -432,11 +596,20 @@ def _plotter(x: np.array, y: np.array) -> Tuple['plt.fig', 'plt.Axes']:
 
     """
 
-    # Check if matplotlib is installed
-    _missing_library()
-    import matplotlib.pyplot as plt
-
-    fig, ax = plt.subplots(1, 1)
+    # Import matplotlib on first use and keep the module for later plots
+    global _plt
+    if _plt is None:
+        try:
+            import matplotlib.pyplot as plt
+        except ImportError:
+            raise ImportError(
+                ("'matplotlib' is required to output the singularity "
+                 "spectrum plots. Please install 'matplotlib'."
+                 )
+            )
+        _plt = plt
+
+    fig, ax = _plt.subplots(1, 1)
 
     ax.plot(x, y, 'o', color='black')
 
@@ -444,15 +617,3 @@ def _plotter(x: np.array, y: np.array) -> Tuple['plt.fig', 'plt.Axes']:
 
     return fig, ax
 
-
-def _missing_library() -> None:
-    try:
-        import matplotlib.pyplot as plt
-    except ImportError:
-        raise ImportError(
-            ("'matplotlib' is required to output the singularity "
-             "spectrum plots. Please install 'matplotlib'."
-             )
-        )
-
-    return
@@ -1,4 +1,5 @@
 import numpy as np
+import pytest
 
 import sys
 sys.path.append("../")
@@ -40,3 +41,97 @@ def test_spectrum():
                 singspect._slopes(lag, dfa, q[0:3])
             except Exception:
                 pass
+
+def test_slopes():
+    from numpy.polynomial.polynomial import polyfit
+
+    X = np.cumsum(np.random.normal(0, 5, size=10000))
+
+    q = np.linspace(-10, 10, 21)
+    q = q[q!=0.0]
+
+    lag = np.unique(
+          np.logspace(
+          0, np.log10(X.size // 4), 55
+          ).astype(int) + 3
+        )
+
+    lag, dfa = MFDFA(X, lag=lag, q=q, order=1)
+
+    lim = [int(lag.size // 8), int(lag.size // 1.5)]
+    _, slopes = singspect._slopes(lag, dfa, q, lim)
+
+    for i in range(q.size):
+        expected = polyfit(np.log(lag[lim[0]:lim[1]]),
+                           np.log(dfa[lim[0]:lim[1], i]), 1)[1]
+        assert np.isclose(slopes[i], expected), "Slopes mismatch"
+
+    with pytest.raises(ValueError):
+        singspect._slopes_raw(np.log([8., 8.]), np.ones((2, q.size)))
+
+    with pytest.raises(ValueError):
+        singspect._slopes_raw(np.log([8.]), np.ones((1, q.size)))
+
+def test_central_diff():
+    q = np.linspace(-10, 10, 21)
+    q = q[q!=0.0]
+    tau = q ** 3 - 1
+
+    alpha = singspect._central_diff(tau, q)
+    assert np.allclose(alpha, np.gradient(tau) / np.gradient(q)), \
+        "Derivative mismatch"
+
+    with pytest.raises(ValueError):
+        singspect._central_diff(tau[:1], q[:1])
+
+def test_resolve_lim():
+    lag = np.arange(4, 52)
+
+    assert singspect._resolve_lim(lag, None) == (6, 32)
+    assert singspect._resolve_lim(lag, [False, False]) == (6, 32)
+    assert singspect._resolve_lim(lag, (None, None)) == (0, 48)
+    assert singspect._resolve_lim(lag, [None, None]) == (0, 48)
+    assert singspect._resolve_lim(lag, [2, None]) == (2, 48)
+
+    assert singspect._resolve_lim(lag, (5, -3)) == (5, 45)
+    lim = [False, False]
+    singspect._resolve_lim(lag, lim)
+    assert lim == [False, False], "Limits were modified"
+
+    for lim in [(5, 5), (20, 2), (3, 4), (-1, None)]:
+        with pytest.raises(ValueError):
+            singspect._resolve_lim(lag, lim)
+
+    with pytest.raises(ValueError):
+        singspect._resolve_lim(np.arange(4, 6), None)
+
+def test_precomputed_logs():
+    X = np.cumsum(np.random.normal(0, 5, size=10000))
+
+    q = np.linspace(-10, 10, 21)
+    q = q[q!=0.0]
+
+    lag = np.unique(
+          np.logspace(
+          0, np.log10(X.size // 4), 55
+          ).astype(int) + 3
+        )
+
+    lag, dfa = MFDFA(X, lag=lag, q=q, order=1)
+
+    log_lag, log_dfa = np.log(lag), np.log(dfa)
+
+    for lim in [None, (None, None), (2, 20)]:
+        alpha, f = singspect.singularity_spectrum(lag, dfa, q=q, lim=lim)
+        alpha_, f_ = singspect.singularity_spectrum(lag, dfa, q=q, lim=lim,
+            log_lag=log_lag, log_mfdfa=log_dfa)
+        assert np.allclose(alpha, alpha_) and np.allclose(f, f_), \
+            "Precomputed logarithms mismatch"
+
+        _, hq = singspect.hurst_exponents(lag, dfa, q=q, lim=lim)
+        _, hq_ = singspect.hurst_exponents(lag, dfa, q=q, lim=lim,
+            log_lag=log_lag, log_mfdfa=log_dfa)
+        assert np.allclose(hq, hq_), "Precomputed logarithms mismatch"
+
+    with pytest.raises(ValueError):
+        singspect.scaling_exponents(lag, dfa, q=q, log_mfdfa=log_dfa[1:])